@@ -2,15 +2,14 @@ import logging
 from typing import Annotated, Optional
 
 import typer
+from rich.markup import escape
 from rich.panel import Panel
 from rich.text import Text
 
-from djinit.creators.app import AppCreator
-from djinit.creators.setup import SetupCreator
 from djinit.ui.console import UIColors, UIFormatter, console
-from djinit.ui.input import get_user_input
-from djinit.utils.secretkey import display_secret_keys, generate_multiple_keys
-from djinit.utils.validators import validate_app_name
+
+# Command-specific modules (creators and interactive prompts) are imported inside each
+# command so `--help`, `--version` and `secret` don't pay for the whole scaffolding stack.
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -56,18 +55,21 @@ def secret(
     """
     Generate Django secret keys.
     """
+    from djinit.utils.secretkey import display_secret_keys, generate_multiple_keys
+
     keys = generate_multiple_keys(count, length)
     UIFormatter.print_info("")
     display_secret_keys(keys)
 
-    instructions = Text()
-    instructions.append("📋 Usage Instructions:\n", style=UIColors.ACCENT)
-    instructions.append("1. Copy the appropriate secret key for your environment\n")
-    instructions.append("2. Add it to your .env file:\n")
-    instructions.append("   SECRET_KEY=your_secret_key_here\n", style=UIColors.CODE)
-    instructions.append("3. Or set it as an environment variable:\n")
-    instructions.append("   export SECRET_KEY=your_secret_key_here\n", style=UIColors.CODE)
-    instructions.append("4. Never commit secret keys to version control!\n", style=UIColors.WARNING)
+    instructions = Text.from_markup(
+        f"[{UIColors.ACCENT}]📋 Usage Instructions:\n[/]"
+        "1. Copy the appropriate secret key for your environment\n"
+        "2. Add it to your .env file:\n"
+        f"[{UIColors.CODE}]   SECRET_KEY=your_secret_key_here\n[/]"
+        "3. Or set it as an environment variable:\n"
+        f"[{UIColors.CODE}]   export SECRET_KEY=your_secret_key_here\n[/]"
+        f"[{UIColors.WARNING}]4. Never commit secret keys to version control!\n[/]"
+    )
 
     console.print(Panel(instructions, title="💡 How to Use", border_style="blue"))
     console.print()
@@ -78,6 +80,9 @@ def create_app(app_names: Annotated[list[str], typer.Argument(help="Name(s) of t
     """
     Create one or more Django apps.
     """
+    from djinit.creators.app import AppCreator
+    from djinit.utils.validators import validate_app_name
+
     UIFormatter.print_info("")
     UIFormatter.print_header("Django App Creation")
     UIFormatter.print_info("")
@@ -112,13 +117,14 @@ def create_app(app_names: Annotated[list[str], typer.Argument(help="Name(s) of t
     if any_failure:
         raise typer.Exit(1)
 
-    instructions = Text()
-    instructions.append("🚀 Next Steps:\n", style=UIColors.ACCENT)
-    instructions.append("1. The app(s) have been added to INSTALLED_APPS in settings/base.py\n")
-    instructions.append("2. Create your models in each app's models.py\n")
-    instructions.append("3. Run migrations: just makemigrations\n")
-    instructions.append("4. Apply migrations: just migrate\n")
-    instructions.append("5. Create views, serializers and routes(URLs) for your app(s)\n")
+    instructions = Text.from_markup(
+        f"[{UIColors.ACCENT}]🚀 Next Steps:\n[/]"
+        "1. The app(s) have been added to INSTALLED_APPS in settings/base.py\n"
+        "2. Create your models in each app's models.py\n"
+        "3. Run migrations: just makemigrations\n"
+        "4. Apply migrations: just migrate\n"
+        "5. Create views, serializers and routes(URLs) for your app(s)\n"
+    )
 
     console.print(Panel(instructions, title="💡 What's Next", border_style="green"))
     UIFormatter.print_info("")
@@ -129,6 +135,9 @@ def setup():
     """
     Interactively set up a new Django project.
     """
+    from djinit.creators.setup import SetupCreator
+    from djinit.ui.input import get_user_input
+
     UIFormatter.print_header("Django Project Setup")
 
     project_dir, project_name, primary_app, app_names, metadata = get_user_input()
@@ -141,12 +150,13 @@ def setup():
         UIFormatter.print_header("Setup Complete!")
         console.print(f"[bold green]Project '{project_name}' has been successfully created![/bold green]")
 
-        instructions = Text()
-        instructions.append("🚀 Next Steps:\n", style=UIColors.ACCENT)
-        instructions.append(f"1. cd {project_dir}\n")
-        instructions.append("2. Install dependencies: pip install -r requirements.txt\n")
-        instructions.append("3. Run migrations: just migrate (or python manage.py migrate)\n")
-        instructions.append("4. Start server: just run (or python manage.py runserver)\n")
+        instructions = Text.from_markup(
+            f"[{UIColors.ACCENT}]🚀 Next Steps:\n[/]"
+            f"1. cd {escape(project_dir)}\n"
+            "2. Install dependencies: pip install -r requirements.txt\n"
+            "3. Run migrations: just migrate (or python manage.py migrate)\n"
+            "4. Start server: just run (or python manage.py runserver)\n"
+        )
 
         console.print(Panel(instructions, title="Get Started", border_style="green"))
     else:
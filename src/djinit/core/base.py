@@ -12,6 +12,8 @@ class BaseObject:
     Base object for all djinit classes.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         pass
 
@@ -22,6 +24,8 @@ class BaseService(BaseObject):
     Services handle business logic and orchestration.
     """
 
+    __slots__ = ("project_root",)
+
     def __init__(self, project_root: str = None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.project_root = project_root
@@ -1,6 +1,22 @@
 import re
+from functools import lru_cache
+from types import CodeType
 from typing import Any, Dict, List
 
+_SAFE_GLOBALS = {"__builtins__": {}}
+_VARIABLE_PATTERN = re.compile(r"\[\[\s*(.*?)\s*\]\]")
+
+
+@lru_cache(maxsize=None)
+def _compile_expression(expr: str) -> CodeType:
+    """Compile a template expression once; templates re-evaluate the same few expressions constantly."""
+    # eval() of a string ignores leading spaces and tabs, so mirror that here
+    return compile(expr.lstrip(" \t"), "<template>", "eval")
+
+
+def _evaluate(expr: str, context: Dict[str, Any]) -> Any:
+    return eval(_compile_expression(expr), _SAFE_GLOBALS, context)
+
 
 class InFileLogicParser:
     """
@@ -20,7 +36,7 @@ class InFileLogicParser:
         key = key.strip()
         try:
             # Try evaluating the expression in the context
-            return str(eval(key, {"__builtins__": {}}, self.context))
+            return str(_evaluate(key, self.context))
         except (NameError, SyntaxError, KeyError, TypeError, AttributeError):
             # Fallback for common patterns or just return the key as is if it fails
             return f"[[ {key} ]]"
@@ -44,7 +60,7 @@ class InFileLogicParser:
             if stripped.startswith("# @IF "):
                 expr = stripped[6:].strip()
                 try:
-                    result = bool(eval(expr, {"__builtins__": {}}, self.context))
+                    result = bool(_evaluate(expr, self.context))
                 except Exception:
                     result = False
                 stack.append([result, result])
@@ -65,7 +81,7 @@ class InFileLogicParser:
                     current_stack[0] = False
                 else:
                     try:
-                        result = bool(eval(expr, {"__builtins__": {}}, self.context))
+                        result = bool(_evaluate(expr, self.context))
                     except Exception:
                         result = False
                     current_stack[0] = result
@@ -118,7 +134,7 @@ class InFileLogicParser:
                     var_name = parts[0].strip()
                     iterable_name = parts[1].strip()
                     try:
-                        iterable = eval(iterable_name, {"__builtins__": {}}, self.context)
+                        iterable = _evaluate(iterable_name, self.context)
                     except Exception:
                         iterable = []
 
@@ -142,9 +158,11 @@ class InFileLogicParser:
                     # Execute loop
                     if hasattr(iterable, "__iter__"):
                         old_val = self.context.get(var_name)
+                        # Join the body once; only the loop variable changes between iterations
+                        loop_text = "\n".join(loop_body)
                         for val in iterable:
                             self.context[var_name] = val
-                            rendered_body = self.render("\n".join(loop_body), self.context)
+                            rendered_body = self.render(loop_text, self.context)
                             final_lines.extend(rendered_body.splitlines())
                         if old_val is not None:
                             self.context[var_name] = old_val
@@ -168,7 +186,7 @@ class InFileLogicParser:
 
             # Variable substitution
             rendered_line = line
-            matches = re.findall(r"\[\[\s*(.*?)\s*\]\]", rendered_line)
+            matches = _VARIABLE_PATTERN.findall(rendered_line)
             for match in matches:
                 value = self._get_value(match)
                 # Replace all variations of the variable syntax
@@ -197,7 +215,7 @@ class InFileLogicParser:
                     post_content = expr_parts[1].lstrip()
 
                 try:
-                    if bool(eval(expr, {"__builtins__": {}}, self.context)):
+                    if bool(_evaluate(expr, self.context)):
                         # If Case 1, we want pre_content. If Case 2, we want post_content.
                         # Usually, if pre_content is empty (or just whitespace), it's Case 2.
                         if pre_content:
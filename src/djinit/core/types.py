@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectMetadata:
     package_name: str
     use_github_actions: bool = False
@@ -24,6 +24,7 @@ class ProjectMetadata:
     project_module_name: str | None = None
 
     def to_dict(self) -> dict:
+        # A fresh dict each call: callers such as SetupCreator normalise it in place
         return {
             "package_name": self.package_name,
             "use_github_actions": self.use_github_actions,
@@ -42,7 +43,7 @@ class ProjectMetadata:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectSetup:
     project_dir: str
     project_name: str
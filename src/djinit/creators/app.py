@@ -17,9 +17,10 @@ class AppCreator(BaseService):
         super().__init__()
         self.app_name = app_name
         self.current_dir = os.getcwd()
-        self.manage_py_path = os.path.join(self.current_dir, "manage.py")
         self.config = CommonUtils.get_djinit_config(self.current_dir)
         self._project_structure_cache = None
+        self._root_entries_cache = None
+        self._project_dir_cache = None
 
     def create_app(self) -> bool:
         if not self._is_django_project():
@@ -56,8 +57,20 @@ class AppCreator(BaseService):
         UIFormatter.print_success(f"Django app '{self.app_name}' created and configured successfully!")
         return True
 
+    def _root_entries(self) -> dict[str, bool]:
+        """Snapshot of the project root (name -> is_dir), listed once and shared by every probe."""
+        if self._root_entries_cache is None:
+            self._root_entries_cache = CommonUtils.scan_directory(self.current_dir)
+        return self._root_entries_cache
+
+    def _find_project_dir(self) -> tuple[Optional[str], Optional[str]]:
+        """Locate the config package (and its settings/base.py) from the root snapshot, once."""
+        if self._project_dir_cache is None:
+            self._project_dir_cache = CommonUtils.find_project_dir(self.current_dir, self._root_entries())
+        return self._project_dir_cache
+
     def _is_django_project(self) -> bool:
-        return CommonUtils.is_django_project(self.current_dir)
+        return "manage.py" in self._root_entries()
 
     def _get_structure_type(self) -> str:
         """Determine the project structure type."""
@@ -107,14 +120,14 @@ class AppCreator(BaseService):
             app_path = os.path.join(self.current_dir, "apps", self.app_name)
         else:
             _, _, apps_base_dir = self._get_project_structure()
+            if apps_base_dir == self.current_dir:
+                return self.app_name in self._root_entries()
             app_path = os.path.join(apps_base_dir, self.app_name)
-        return os.path.exists(app_path)
+        # Any entry with this name (even a dangling symlink) blocks creating the app directory
+        return os.path.lexists(app_path)
 
     def _create_django_app(self) -> bool:
-        if not os.path.exists(self.manage_py_path):
-            UIFormatter.print_error("Could not find manage.py file in project root")
-            return False
-
+        # manage.py presence was already verified by create_app via _is_django_project
         if self._is_predefined_structure():
             return self._create_predefined_app(os.path.join(self.current_dir, "apps"))
 
@@ -146,25 +159,29 @@ class AppCreator(BaseService):
             module_name = self.config.get("project_name") if self.config else None
             if not module_name:
                 # Fallback: find settings directory
-                settings_path = CommonUtils.find_settings_path(self.current_dir)
+                settings_path = self._find_settings_path()
             else:
                 settings_path = os.path.join(self.current_dir, module_name, "settings")
         else:
             # Standard or predefined structure
-            settings_path = CommonUtils.find_settings_path(self.current_dir)
+            settings_path = self._find_settings_path()
 
-        if not settings_path or not os.path.exists(settings_path):
+        if not settings_path:
             UIFormatter.print_error("Could not find Django settings directory")
             return False
 
         base_settings_path = os.path.join(settings_path, "base.py")
-        if not os.path.exists(base_settings_path):
-            UIFormatter.print_error("Could not find base.py settings file")
+        try:
+            with open(base_settings_path, encoding="utf-8") as f:
+                content = f.read()
+        except (FileNotFoundError, NotADirectoryError):
+            # Work out which part is missing only on the failure path
+            if os.path.exists(settings_path):
+                UIFormatter.print_error("Could not find base.py settings file")
+            else:
+                UIFormatter.print_error("Could not find Django settings directory")
             return False
 
-        with open(base_settings_path) as f:
-            content = f.read()
-
         # Calculate the app module path based on structure
         app_module_path = self._calculate_app_module_path(structure_type)
 
@@ -177,7 +194,7 @@ class AppCreator(BaseService):
             effective_nested_dir = "apps"
         elif structure_type == "single":
             # For single structure, app is inside the project module
-            project_dir, _ = CommonUtils.find_project_dir(self.current_dir)
+            project_dir, _ = self._find_project_dir()
             effective_nested_dir = os.path.basename(project_dir) if project_dir else None
             nested = True
         else:
@@ -188,21 +205,18 @@ class AppCreator(BaseService):
         # We'll check if either the module path or the full config path exists
         # but we'll prefer adding the full config path
 
-        existing_apps = CommonUtils.extract_existing_apps(content)
-
         # Check if full config is already there
-        if full_app_config in existing_apps:
+        if CommonUtils.has_user_defined_app(content, full_app_config):
             UIFormatter.print_success(f"App '{full_app_config}' already configured in USER_DEFINED_APPS")
             return True
 
         # Check if legacy module path is there, if so, upgrade it
-        if app_module_path in existing_apps:
+        if CommonUtils.has_user_defined_app(content, app_module_path):
             UIFormatter.print_info(f"Upgrading app configuration from '{app_module_path}' to '{full_app_config}'...")
             updated_content = CommonUtils.replace_app_in_user_defined_apps(content, app_module_path, full_app_config)
 
             if updated_content:
-                with open(base_settings_path, "w") as f:
-                    f.write(updated_content)
+                CommonUtils.replace_file_content(base_settings_path, updated_content)
                 UIFormatter.print_success(f"Upgraded '{app_module_path}' to '{full_app_config}' in USER_DEFINED_APPS")
                 return True
             else:
@@ -217,8 +231,7 @@ class AppCreator(BaseService):
         if not updated_content:
             return False
 
-        with open(base_settings_path, "w") as f:
-            f.write(updated_content)
+        CommonUtils.replace_file_content(base_settings_path, updated_content)
 
         UIFormatter.print_success(f"Added '{full_app_config}' to USER_DEFINED_APPS in base.py")
         return True
@@ -240,7 +253,7 @@ class AppCreator(BaseService):
                 self._project_structure_cache = (nested, nested_dir, apps_base_dir)
             else:
                 # Fallback to old detection method
-                project_dir, settings_base_path = CommonUtils.find_project_dir(self.current_dir)
+                project_dir, settings_base_path = self._find_project_dir()
 
                 if project_dir is None:
                     self._project_structure_cache = (False, None, self.current_dir)
@@ -250,13 +263,16 @@ class AppCreator(BaseService):
                     )
         return self._project_structure_cache
 
+    def _find_settings_path(self) -> Optional[str]:
+        project_dir, _ = self._find_project_dir()
+        return os.path.join(project_dir, "settings") if project_dir else None
+
     def _is_predefined_structure(self) -> bool:
         if self.config:
             return self.config.get("structure", {}).get("predefined", False)
 
-        apps_dir = os.path.join(self.current_dir, "apps")
-        api_dir = os.path.join(self.current_dir, "api")
-        return os.path.isdir(apps_dir) and os.path.isdir(api_dir)
+        entries = self._root_entries()
+        return entries.get("apps", False) and entries.get("api", False)
 
     def _is_restricted_structure(self) -> bool:
         """Check if the project structure is Unified or Single Folder."""
@@ -269,11 +285,11 @@ class AppCreator(BaseService):
             return True
 
         # Check for Predefined structure (apps/ exists but not apps/api)
-        if os.path.isdir(os.path.join(self.current_dir, "apps")):
+        if self._root_entries().get("apps", False):
             return False
 
         # Check for Single Folder structure (models/ and api/ exist in project dir)
-        project_dir, _ = CommonUtils.find_project_dir(self.current_dir)
+        project_dir, _ = self._find_project_dir()
         if project_dir:
             has_models = os.path.isdir(os.path.join(project_dir, "models"))
             has_api = os.path.isdir(os.path.join(project_dir, "api"))
@@ -298,14 +314,11 @@ class AppCreator(BaseService):
 
     def _add_to_project_urls(self, app_name: str, structure_type: str) -> None:
         """Add app URLs to the main project urls.py."""
-        project_dir, settings_base_path = CommonUtils.find_project_dir(self.current_dir)
+        project_dir, _ = self._find_project_dir()
         if not project_dir:
             return
 
         project_urls = os.path.join(project_dir, "urls.py")
-        if not os.path.exists(project_urls):
-            return
-
         app_module_path = self._calculate_app_module_path(structure_type)
         include_stmt = f'path("", include("{app_module_path}.urls")),'
 
@@ -322,25 +335,25 @@ class AppCreator(BaseService):
                 if idx != -1:
                     content = content[:idx] + f"    {include_stmt}\n" + content[idx:]
 
-            with open(project_urls, "w", encoding="utf-8") as f:
-                f.write(content)
+            CommonUtils.replace_file_content(project_urls, content)
 
-            UIFormatter.print_success(f"Added '{app_name}' URLs to {os.path.basename(project_urls)}")
+            UIFormatter.print_success(f"Added '{app_name}' URLs to urls.py")
+        except FileNotFoundError:
+            # No project urls.py to update; opening directly saves a separate exists() probe
+            return
         except Exception as e:
-            UIFormatter.print_warning(f"Could not automatically update {os.path.basename(project_urls)}: {e}")
+            UIFormatter.print_warning(f"Could not automatically update urls.py: {e}")
 
     def _add_to_api_v1_urls(self, app_name: str) -> None:
-        api_v1_urls = os.path.join(self.current_dir, "api", "v1", "urls.py")
-        if not os.path.exists(api_v1_urls):
-            return
-
-        structure_type = self._get_structure_type()
-        app_module_path = self._calculate_app_module_path(structure_type)
-
+        api_v1_urls = f"{self.current_dir}{os.sep}api{os.sep}v1{os.sep}urls.py"
         try:
+            # A missing api/v1/urls.py raises FileNotFoundError here and is skipped below
             with open(api_v1_urls, encoding="utf-8") as f:
                 content = f.read()
 
+            structure_type = self._get_structure_type()
+            app_module_path = self._calculate_app_module_path(structure_type)
+
             include_stmt = f'path("{app_name}/", include("{app_module_path}.urls")),'
             if include_stmt in content:
                 return
@@ -350,8 +363,7 @@ class AppCreator(BaseService):
                 if idx != -1:
                     content = content[:idx] + f"    {include_stmt}\n" + content[idx:]
 
-            with open(api_v1_urls, "w", encoding="utf-8") as f:
-                f.write(content)
+            CommonUtils.replace_file_content(api_v1_urls, content)
 
             UIFormatter.print_success(f"Added '{app_name}' URLs to api/v1/urls.py")
         except Exception:
@@ -4,13 +4,30 @@ Handles creation and modification of project files.
 """
 
 import os
+from types import MappingProxyType
 
 from djinit.core.base import BaseService
 from djinit.templater import template_engine
+from djinit.ui.console import UIFormatter
 from djinit.utils.common import CommonUtils
 
 
 class FileCreator(BaseService):
+    __slots__ = (
+        "project_name",
+        "app_names",
+        "metadata",
+        "module_name",
+        "project_configs",
+        "settings_folder",
+        "settings_file",
+        "apps_dir",
+        "api_dir",
+        "core_dir",
+        "_base_context",
+        "format_queue",
+    )
+
     def __init__(self, project_root: str, project_name: str, app_names: list, metadata: dict):
         super().__init__(project_root=project_root)
         self.project_name = project_name
@@ -18,8 +35,39 @@ class FileCreator(BaseService):
         self.metadata = metadata
         self.module_name = metadata.get("project_module_name") or project_name
         self.project_configs = os.path.join(project_root, self.module_name)
-        self.settings_folder = os.path.join(self.project_configs, "settings")
-        self.settings_file = os.path.join(self.project_configs, "settings.py")
+        # Fixed sub-paths are precomputed once; only user-supplied segments go through os.path.join
+        self.settings_folder = f"{self.project_configs}{os.sep}settings"
+        self.settings_file = f"{self.project_configs}{os.sep}settings.py"
+        self.apps_dir = f"{project_root}{os.sep}apps"
+        self.api_dir = f"{project_root}{os.sep}api"
+        self.core_dir = f"{project_root}{os.sep}core"
+        # Values shared by most project-level templates; per-file contexts overlay this
+        self._base_context = MappingProxyType(
+            {
+                "project_name": project_name,
+                "module_name": self.module_name,
+                "database_type": metadata.get("database_type", "postgresql"),
+                "use_database_url": metadata.get("use_database_url", True),
+                "use_tailwind": metadata.get("use_tailwind", False),
+                "use_htmx": metadata.get("use_htmx", False),
+                "use_vite": metadata.get("use_vite", False),
+            }
+        )
+        # Files are formatted together by format_all() instead of one Ruff process per file
+        self.format_queue: list[str] = []
+
+    def format_all(self) -> None:
+        """Format every generated file that requested formatting in one Ruff invocation."""
+        CommonUtils.format_files(self.format_queue)
+        self.format_queue.clear()
+
+    def _create_file_from_template(
+        self, file_path: str, template_path: str, context: dict, message: str, should_format: bool = True
+    ) -> None:
+        """Create a file from a template, deferring formatting to format_all()."""
+        CommonUtils.create_file_from_template(file_path, template_path, context, message, should_format=False)
+        if should_format:
+            self.format_queue.append(file_path)
 
     def _render_and_create_file(
         self,
@@ -30,44 +78,53 @@ class FileCreator(BaseService):
         base_dir: str = None,
         should_format: bool = False,
     ) -> None:
-        """Helper to render template and create file."""
-        target_dir = base_dir or self.project_root
-        with CommonUtils.change_cwd(target_dir):
+        """Helper to render template and create file.
+
+        Relative filepaths are resolved against base_dir (or the project root), so nothing
+        depends on the process cwd.
+        """
+        target_path = os.path.join(base_dir or self.project_root, filepath)
+        if should_format:
+            # Ruff rewrites these later anyway, so they go through the shared string path
             content = template_engine.render_template(template_path, context)
-            CommonUtils.create_file_with_content(filepath, content, message, should_format=should_format)
+            CommonUtils.create_file_with_content(target_path, content, message)
+            self.format_queue.append(target_path)
+        else:
+            template_engine.render_to_file(template_path, context, target_path)
+            UIFormatter.print_success(message)
 
     def _create_files_from_specs(self, base_dir: str, folder_specs: dict, base_context: dict = None) -> None:
         """Helper to create multiple folders and files from a specification dict."""
         base_context = base_context or {}
 
         for folder_name, file_templates in folder_specs.items():
-            folder_path = os.path.join(base_dir, folder_name)
+            folder_path = f"{base_dir}{os.sep}{folder_name}"
             CommonUtils.create_directory_with_init(folder_path, f"Created {folder_path}/__init__.py")
 
             for filename, template_path in file_templates:
-                file_path = os.path.join(folder_path, filename)
-                CommonUtils.create_file_from_template(file_path, template_path, base_context, f"Created {file_path}")
+                file_path = f"{folder_path}{os.sep}{filename}"
+                self._create_file_from_template(file_path, template_path, base_context, f"Created {file_path}")
 
     def _create_apps_py(
         self, app_dir: str, app_name: str, app_module: str = None, message: str = None, should_format: bool = False
     ) -> None:
         """Helper to create apps.py file for an app."""
-        apps_py_path = os.path.join(app_dir, "apps.py")
-        app_config_name = app_name.title().replace("_", "")
+        apps_py_path = f"{app_dir}{os.sep}apps.py"
+        app_config_name = CommonUtils.get_app_config_name(app_name)
         context = {
             "app_name": app_name,
             "app_config_name": app_config_name,
             "app_module": app_module or app_name,
         }
-        msg = message or f"Created {os.path.basename(app_dir)}/apps.py"
-        CommonUtils.create_file_from_template(
+        msg = message or f"Created {app_dir.rpartition(os.sep)[2]}/apps.py"
+        self._create_file_from_template(
             apps_py_path, "components/apps.py-tpl", context, msg, should_format=should_format
         )
 
     def _create_subdirectories_with_init(self, base_dir: str, subdirs: list, prefix: str = "") -> None:
         """Helper to create multiple subdirectories with __init__.py files."""
         for subdir in subdirs:
-            subdir_path = os.path.join(base_dir, subdir)
+            subdir_path = f"{base_dir}{os.sep}{subdir}"
             message = f"Created {prefix}{subdir}/__init__.py" if prefix else f"Created {subdir}/__init__.py"
             CommonUtils.create_directory_with_init(subdir_path, message)
 
@@ -94,23 +151,21 @@ class FileCreator(BaseService):
         base_settings_context["use_htmx"] = self.metadata.get("use_htmx", False)
         base_settings_context["use_vite"] = self.metadata.get("use_vite", False)
 
-        for filename, context in [
+        targets = [
             ("base.py", base_settings_context),
             ("development.py", dev_context),
             ("production.py", base_settings_context),
-        ]:
-            filepath = os.path.join(settings_dir, filename)
-            template_path = f"config/settings/{filename.replace('.py', '')}.py-tpl"
-            self._render_and_create_file(
-                filepath,
-                template_path,
-                context,
-                f"Created {prefix}/settings/{filename}",
-                base_dir=os.path.dirname(
-                    settings_dir
-                ),  # Not strictly used by _render_and_create_file but good for context
-                should_format=True,
-            )
+        ]
+        # Render everything first so a template error leaves no partially written settings package
+        rendered = [
+            (filename, template_engine.render_template(f"config/settings/{filename}-tpl", context))
+            for filename, context in targets
+        ]
+
+        for filename, content in rendered:
+            filepath = f"{settings_dir}{os.sep}{filename}"
+            CommonUtils.create_file_with_content(filepath, content, f"Created {prefix}/settings/{filename}")
+            self.format_queue.append(filepath)
 
     def _create_lifecycle_files(
         self, target_dir: str, prefix: str, api_module: str = None, comment_out_api: bool = False
@@ -134,22 +189,16 @@ class FileCreator(BaseService):
         ]
 
         for filename, template, context in files:
-            filepath = os.path.join(target_dir, filename)
+            filepath = f"{target_dir}{os.sep}{filename}"
             self._render_and_create_file(
                 filepath, template, context, f"Created {prefix}/{filename}", should_format=True
             )
 
     def create_dockerfile(self) -> None:
-        context = {
-            "module_name": self.module_name,
-            "database_type": self.metadata.get("database_type", "postgresql"),
-            "use_tailwind": self.metadata.get("use_tailwind", False),
-            "use_vite": self.metadata.get("use_vite", False),
-        }
         self._render_and_create_file(
             "Dockerfile",
             "project/Dockerfile-tpl",
-            context,
+            self._base_context,
             "Created Dockerfile for containerization",
         )
 
@@ -162,55 +211,40 @@ class FileCreator(BaseService):
         )
 
     def create_vite_config(self) -> None:
-        context = {
-            "module_name": self.module_name,
-            "project_name": self.project_name,
-        }
         self._render_and_create_file(
             "vite.config.ts",
             "project/vite.config.ts-tpl",
-            context,
+            self._base_context,
             "Created vite.config.ts for Vite frontend bundling",
         )
 
     def create_gitignore(self) -> None:
-        context = {
-            "use_tailwind": self.metadata.get("use_tailwind", False),
-            "use_vite": self.metadata.get("use_vite", False),
-        }
-        self._render_and_create_file(".gitignore", "project/gitignore-tpl", context, "Created .gitignore file")
+        self._render_and_create_file(
+            ".gitignore", "project/gitignore-tpl", self._base_context, "Created .gitignore file"
+        )
 
     def create_requirements(self) -> None:
-        context = {
-            "use_database_url": self.metadata.get("use_database_url", True),
-            "database_type": self.metadata.get("database_type", "postgresql"),
-            "use_tailwind": self.metadata.get("use_tailwind", False),
-            "use_htmx": self.metadata.get("use_htmx", False),
-            "use_vite": self.metadata.get("use_vite", False),
-        }
         self._render_and_create_file(
             "requirements.txt",
             "project/requirements-tpl",
-            context,
+            self._base_context,
             "Created requirements.txt with Django dependencies",
         )
 
     def create_readme(self) -> None:
         context = {
-            "project_name": self.project_name,
+            **self._base_context,
             "app_names": self.app_names,
             "predefined_structure": bool(self.metadata.get("predefined_structure")),
             "unified_structure": bool(self.metadata.get("unified_structure")),
-            "module_name": self.module_name,
         }
         self._render_and_create_file("README.md", "project/readme.md-tpl", context, "Created README.md file")
 
     def create_env_file(self) -> None:
         """Create .env.sample file with environment variables."""
         context = {
+            **self._base_context,
             "project_name": self.module_name,  # Use module_name here for settings path
-            "use_database_url": self.metadata.get("use_database_url", True),
-            "database_type": self.metadata.get("database_type", "postgresql"),
         }
         self._render_and_create_file(
             ".env.sample",
@@ -222,16 +256,7 @@ class FileCreator(BaseService):
     def create_pyproject(self, metadata: dict) -> None:
         package_name = metadata.get("package_name", "backend")
         package_name = CommonUtils.get_package_name(package_name)
-        context = {
-            "package_name": package_name,
-            "project_name": self.project_name,
-            "module_name": self.module_name,
-            "database_type": metadata.get("database_type", "postgresql"),
-            "use_database_url": metadata.get("use_database_url", True),
-            "use_tailwind": metadata.get("use_tailwind", False),
-            "use_htmx": metadata.get("use_htmx", False),
-            "use_vite": metadata.get("use_vite", False),
-        }
+        context = {**self._base_context, "package_name": package_name}
         self._render_and_create_file(
             "pyproject.toml",
             "project/pyproject.toml-tpl",
@@ -260,25 +285,20 @@ class FileCreator(BaseService):
         )
 
     def create_justfile(self) -> None:
-        context = {
-            "project_name": self.project_name,
-            "module_name": self.module_name,
-            "use_vite": self.metadata.get("use_vite", False),
-        }
         self._render_and_create_file(
             "justfile",
             "project/justfile-tpl",
-            context,
+            self._base_context,
             "Created justfile with Django development tasks",
         )
 
     def create_predefined_structure(self) -> None:
         """Create predefined structure with folder organization only (no example code)."""
-        apps_dir = os.path.join(self.project_root, "apps")
+        apps_dir = self.apps_dir
         CommonUtils.create_directory_with_init(apps_dir, "Created apps/__init__.py")
 
         # Create core app with empty subfolders (no example utilities/middleware)
-        core_dir = os.path.join(apps_dir, "core")
+        core_dir = f"{apps_dir}{os.sep}core"
         CommonUtils.create_directory_with_init(core_dir, "Created apps/core/__init__.py")
 
         # Create empty folders for utilities, mixins, middleware (developers add their own)
@@ -286,28 +306,28 @@ class FileCreator(BaseService):
         self._create_subdirectories_with_init(core_dir, core_subfolders, "apps/core/")
 
         # Create api directory structure
-        api_dir = os.path.join(self.project_root, "api")
+        api_dir = self.api_dir
         CommonUtils.create_directory_with_init(api_dir, "Created api/__init__.py")
-        api_urls_path = os.path.join(api_dir, "urls.py")
-        CommonUtils.create_file_from_template(
+        api_urls_path = f"{api_dir}{os.sep}urls.py"
+        self._create_file_from_template(
             api_urls_path,
             "config/urls.py-tpl",
             {"url_type": "api_root", "app_name": "api", "version": "v1", "api_module": "api"},
             "Created api/urls.py",
         )
 
-        api_v1_dir = os.path.join(api_dir, "v1")
+        api_v1_dir = f"{api_dir}{os.sep}v1"
         CommonUtils.create_directory_with_init(api_v1_dir, "Created api/v1/__init__.py")
-        api_v1_urls_path = os.path.join(api_v1_dir, "urls.py")
-        CommonUtils.create_file_from_template(
+        api_v1_urls_path = f"{api_v1_dir}{os.sep}urls.py"
+        self._create_file_from_template(
             api_v1_urls_path,
             "config/urls.py-tpl",
             {"url_type": "api_version", "app_name": "v1", "app_list": self.app_names, "app_module": "apps"},
             "Created api/v1/urls.py",
         )
 
-        project_urls_path = os.path.join(self.project_configs, "urls.py")
-        CommonUtils.create_file_from_template(
+        project_urls_path = f"{self.project_configs}{os.sep}urls.py"
+        self._create_file_from_template(
             project_urls_path,
             "config/urls.py-tpl",
             {
@@ -323,11 +343,12 @@ class FileCreator(BaseService):
 
     def create_unified_structure(self) -> None:
         # 1. Create 'core' directory (Project Config)
-        core_dir = os.path.join(self.project_root, "core")
-        CommonUtils.create_directory_with_init(core_dir, "Created core/__init__.py")
-
-        settings_dir = os.path.join(core_dir, "settings")
-        CommonUtils.create_directory_with_init(settings_dir, "Created core/settings/__init__.py")
+        core_dir = self.core_dir
+        settings_dir = f"{core_dir}{os.sep}settings"
+        # One makedirs creates both the config package and its settings package
+        os.makedirs(settings_dir, exist_ok=True)
+        CommonUtils.create_init_file(core_dir, "Created core/__init__.py")
+        CommonUtils.create_init_file(settings_dir, "Created core/settings/__init__.py")
 
         # Create settings files
         base_context = {
@@ -342,7 +363,7 @@ class FileCreator(BaseService):
         self._create_lifecycle_files(core_dir, "core", api_module="apps.api")
 
         # 2. Create 'apps' directory (The Main App)
-        apps_dir = os.path.join(self.project_root, "apps")
+        apps_dir = self.apps_dir
         CommonUtils.create_directory_with_init(apps_dir, "Created apps/__init__.py")
 
         # Create apps.py for the 'apps' app
@@ -353,22 +374,22 @@ class FileCreator(BaseService):
         self._create_subdirectories_with_init(apps_dir, components, "apps/")
 
         # Create 'api' directory with v1
-        api_dir = os.path.join(apps_dir, "api")
+        api_dir = f"{apps_dir}{os.sep}api"
         CommonUtils.create_directory_with_init(api_dir, "Created apps/api/__init__.py")
 
-        CommonUtils.create_file_from_template(
-            os.path.join(api_dir, "urls.py"),
+        self._create_file_from_template(
+            f"{api_dir}{os.sep}urls.py",
             "config/urls.py-tpl",
             {"url_type": "api_root", "app_name": "api", "version": "v1", "api_module": "apps.api"},
             "Created apps/api/urls.py",
             should_format=True,
         )
 
-        api_v1_dir = os.path.join(api_dir, "v1")
+        api_v1_dir = f"{api_dir}{os.sep}v1"
         CommonUtils.create_directory_with_init(api_v1_dir, "Created apps/api/v1/__init__.py")
 
-        CommonUtils.create_file_from_template(
-            os.path.join(api_v1_dir, "urls.py"),
+        self._create_file_from_template(
+            f"{api_v1_dir}{os.sep}urls.py",
             "config/urls.py-tpl",
             {"url_type": "api_version", "app_name": "v1", "app_list": [], "app_module": "apps"},
             "Created apps/api/v1/urls.py",
@@ -377,11 +398,11 @@ class FileCreator(BaseService):
 
     def create_single_structure(self) -> None:
         """Create single folder structure with minimal files (no example code)."""
-        project_dir = os.path.join(self.project_root, self.module_name)
-        CommonUtils.create_directory_with_init(project_dir, f"Created {self.module_name}/__init__.py")
-
-        settings_dir = os.path.join(project_dir, "settings")
-        CommonUtils.create_directory_with_init(settings_dir, f"Created {self.module_name}/settings/__init__.py")
+        project_dir = self.project_configs
+        settings_dir = self.settings_folder
+        os.makedirs(settings_dir, exist_ok=True)
+        CommonUtils.create_init_file(project_dir, f"Created {self.module_name}/__init__.py")
+        CommonUtils.create_init_file(settings_dir, f"Created {self.module_name}/settings/__init__.py")
 
         # Create settings files
         base_context = {
@@ -402,26 +423,25 @@ class FileCreator(BaseService):
         self._create_subdirectories_with_init(project_dir, components, f"{self.module_name}/")
 
         # Create README files for guidance
-        CommonUtils.create_file_from_template(
-            os.path.join(project_dir, "api", "README.md"),
+        self._create_file_from_template(
+            f"{project_dir}{os.sep}api{os.sep}README.md",
             "components/api_readme.md-tpl",
             {"module_name": self.module_name},
             f"Created {self.module_name}/api/README.md",
         )
 
-        CommonUtils.create_file_from_template(
-            os.path.join(project_dir, "models", "README.md"),
+        self._create_file_from_template(
+            f"{project_dir}{os.sep}models{os.sep}README.md",
             "components/models_readme.md-tpl",
             {"module_name": self.module_name},
             f"Created {self.module_name}/models/README.md",
         )
 
     def create_procfile(self) -> None:
-        context = {"project_name": self.project_name, "module_name": self.module_name}
         self._render_and_create_file(
             "Procfile",
             "project/procfile-tpl",
-            context,
+            self._base_context,
             "Created Procfile with Gunicorn configuration",
         )
 
@@ -435,40 +455,22 @@ class FileCreator(BaseService):
         )
 
     def create_github_actions(self) -> None:
-        github_dir = os.path.join(self.project_root, ".github", "workflows")
+        github_dir = f"{self.project_root}{os.sep}.github{os.sep}workflows"
         os.makedirs(github_dir, exist_ok=True)
-        context = {
-            "project_name": self.project_name,
-            "module_name": self.module_name,
-            "database_type": self.metadata.get("database_type", "postgresql"),
-            "use_database_url": self.metadata.get("use_database_url", True),
-            "use_tailwind": self.metadata.get("use_tailwind", False),
-            "use_htmx": self.metadata.get("use_htmx", False),
-            "use_vite": self.metadata.get("use_vite", False),
-        }
-        workflow_file = os.path.join(github_dir, "ci.yml")
+        workflow_file = f"{github_dir}{os.sep}ci.yml"
         self._render_and_create_file(
             workflow_file,
             "project/ci/github_actions-tpl",
-            context,
+            self._base_context,
             "Created Github Actions workflow (ci.yml)",
             base_dir=self.project_root,
         )
 
     def create_gitlab_ci(self) -> None:
-        context = {
-            "project_name": self.project_name,
-            "module_name": self.module_name,
-            "database_type": self.metadata.get("database_type", "postgresql"),
-            "use_database_url": self.metadata.get("use_database_url", True),
-            "use_tailwind": self.metadata.get("use_tailwind", False),
-            "use_htmx": self.metadata.get("use_htmx", False),
-            "use_vite": self.metadata.get("use_vite", False),
-        }
         self._render_and_create_file(
             ".gitlab-ci.yml",
             "project/ci/gitlab_ci-tpl",
-            context,
+            self._base_context,
             "Created GitLab CI configuration (.gitlab-ci.yml)",
         )
 
@@ -506,7 +508,7 @@ class FileCreator(BaseService):
             },
         }
 
-        filepath = os.path.join(self.project_root, ".djinit")
+        filepath = f"{self.project_root}{os.sep}.djinit"
         CommonUtils.create_file_with_content(
             filepath, json.dumps(config, indent=4), "Created .djinit configuration file"
         )
@@ -12,7 +12,7 @@ from djinit.utils.django import DjangoHelper
 
 
 class ProjectCreator(BaseService):
-    def __init__(self, project_dir: str, project_name: str, app_names: list, metadata: dict):
+    def __init__(self, project_dir: str, project_name: str, app_names: list, metadata: dict, format_queue: list = None):
         super().__init__(project_root=os.getcwd() if project_dir == "." else os.path.join(os.getcwd(), project_dir))
         self.project_dir = project_dir
         self.project_name = project_name
@@ -22,12 +22,22 @@ class ProjectCreator(BaseService):
         # logic was: self.project_root = os.getcwd() if project_dir == "." else os.path.join(os.getcwd(), project_dir)
         # which I passed to super. So I can remove the line setting self.project_root here.
         self.module_name = metadata.get("project_module_name") or self.project_name
+        # Shared with FileCreator so every generated file is formatted in one Ruff run
+        self.format_queue = format_queue
 
     def create_project(self) -> None:
         os.makedirs(self.project_root, exist_ok=True)
 
-        unified = self.metadata.get("unified_structure", False)
-        DjangoHelper.startproject(self.module_name, self.project_root, unified=unified, metadata=self.metadata)
+        # Unified and single layouts write their whole config package in FileCreator, so anything
+        # startproject put there would be overwritten moments later; only manage.py is needed
+        manage_py_only = self.metadata.get("unified_structure", False) or self.metadata.get("single_structure", False)
+        DjangoHelper.startproject(
+            self.module_name,
+            self.project_root,
+            manage_py_only=manage_py_only,
+            metadata=self.metadata,
+            format_queue=self.format_queue,
+        )
         UIFormatter.print_success(f"Django project '{self.project_name}' created successfully!")
 
     def _get_apps_base_dir(self) -> str:
@@ -59,16 +69,12 @@ class ProjectCreator(BaseService):
         """Add all apps to USER_DEFINED_APPS in base.py settings file."""
         base_settings_path = CommonUtils.get_base_settings_path(self.project_root, self.module_name)
 
-        if not os.path.exists(base_settings_path):
-            from djinit.utils.exceptions import ConfigError
-
-            raise ConfigError("Could not find base.py settings file")
-
+        # read_base_settings returns None when base.py is missing, so no separate exists() probe
         content = CommonUtils.read_base_settings(self.project_root, self.module_name)
         if content is None:
             from djinit.utils.exceptions import ConfigError
 
-            raise ConfigError("Could not read base.py settings file")
+            raise ConfigError("Could not find base.py settings file")
 
         nested = bool(self.metadata.get("nested_apps"))
         nested_dir = self.metadata.get("nested_dir")
@@ -101,8 +107,7 @@ class ProjectCreator(BaseService):
                     upgraded = True
 
             if upgraded:
-                with open(base_settings_path, "w") as f:
-                    f.write(content)
+                CommonUtils.replace_file_content(base_settings_path, content)
                 UIFormatter.print_success("Upgraded existing apps to full AppConfig paths")
                 return
 
@@ -115,8 +120,7 @@ class ProjectCreator(BaseService):
 
             raise ConfigError("Could not update USER_DEFINED_APPS in base.py")
 
-        with open(base_settings_path, "w") as f:
-            f.write(updated_content)
+        CommonUtils.replace_file_content(base_settings_path, updated_content)
 
         added_apps_str = ", ".join(apps_to_add)
         UIFormatter.print_success(f"Added apps to USER_DEFINED_APPS: {added_apps_str}")
@@ -176,12 +180,20 @@ class ProjectCreator(BaseService):
                 ]
                 required_files.extend(app_files)
 
+        # List each parent directory once instead of stat'ing every required file
+        listings: dict[str, dict[str, bool]] = {}
         missing_files = []
         for file_path in required_files:
-            if file_path.endswith("settings"):
-                if not os.path.isdir(file_path):
-                    missing_files.append(file_path)
-            elif not os.path.exists(file_path):
+            parent, _, name = file_path.rpartition(os.sep)
+            entries = listings.get(parent)
+            if entries is None:
+                try:
+                    entries = CommonUtils.scan_directory(parent)
+                except OSError:
+                    entries = {}
+                listings[parent] = entries
+
+            if name not in entries or (name == "settings" and not entries[name]):
                 missing_files.append(file_path)
 
         if not missing_files:
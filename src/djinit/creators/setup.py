@@ -23,8 +23,10 @@ class SetupCreator:
         else:
             self.project_root = os.path.join(os.getcwd(), project_dir)
 
-        self.project_creator = ProjectCreator(project_dir, project_name, app_names, metadata)
         self.file_creator = FileCreator(self.project_root, project_name, app_names, metadata)
+        self.project_creator = ProjectCreator(
+            project_dir, project_name, app_names, metadata, format_queue=self.file_creator.format_queue
+        )
 
     def _normalize_metadata(self) -> None:
         """Normalize metadata and app names based on structure type."""
@@ -77,6 +79,7 @@ class SetupCreator:
                 ("Creating Justfile", self.file_creator.create_justfile),
                 ("Creating runtime.txt", self.file_creator.create_runtime_txt),
                 ("Creating CI/CD pipelines", self._create_cicd_pipelines),
+                ("Formatting generated files", self.file_creator.format_all),
             ]
         )
 
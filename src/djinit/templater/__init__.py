@@ -5,7 +5,7 @@ Handles loading and rendering Jinja2 templates for file generation.
 
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from djinit.core.base import BaseService
 from djinit.core.parser import InFileLogicParser
@@ -30,7 +30,9 @@ class TemplateEngine(BaseService):
             raise FileNotFoundError(f"Template directory not found: {template_dir}")
 
         self.template_dir = str(template_dir)
-        self.parser = InFileLogicParser()
+        # Template sources are read from disk once per process and reused across renders,
+        # paired with the precomputed output of templates that contain no template logic
+        self._template_cache: Dict[str, Tuple[str, Optional[str]]] = {}
 
     def render_template(self, template_name: str, context: Dict[str, Any]) -> str:
         """Render a template with the given context.
@@ -42,14 +44,51 @@ class TemplateEngine(BaseService):
         Returns:
             Rendered template content as string
         """
-        template_path = os.path.join(self.template_dir, template_name)
-        if not os.path.exists(template_path):
-            raise FileNotFoundError(f"Template not found: {template_path}")
+        template_text, static_output = self._load_template(template_name)
+        if static_output is not None:
+            return static_output
+
+        # The parser binds @LOOP variables into its context while rendering; a copy keeps them,
+        # even after a failed render, out of the caller's dict, which creators reuse across templates
+        return InFileLogicParser(dict(context)).render(template_text)
+
+    def _load_template(self, template_name: str) -> Tuple[str, Optional[str]]:
+        """Return the template source and, for static templates, their rendered output.
+
+        Both are computed on first use only. A template without ``[[ ]]`` placeholders
+        or ``# @`` markers renders to the same text for every context.
+        """
+        cached = self._template_cache.get(template_name)
+        if cached is None:
+            template_path = os.path.join(self.template_dir, template_name)
+            try:
+                with open(template_path, encoding="utf-8") as f:
+                    template_text = f.read()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Template not found: {template_path}") from None
+
+            static_output = None
+            if "[[" not in template_text and "# @" not in template_text:
+                static_output = "\n".join(template_text.splitlines())
+            cached = self._template_cache[template_name] = (template_text, static_output)
+        return cached
+
+    def render_to_file(self, template_name: str, context: Dict[str, Any], path: str | os.PathLike) -> None:
+        """Render a template and write it straight to disk as UTF-8.
 
-        with open(template_path) as f:
-            template_text = f.read()
+        Args:
+            template_name: Name of the template file (e.g., 'gitignore.py-tpl')
+            context: Dictionary of variables to pass to the template
+            path: Destination file path; existing files are overwritten
+        """
+        data = self.render_template(template_name, context).encode("utf-8")
+        try:
+            with open(path, "wb") as f:
+                f.write(data)
+        except OSError as e:
+            from djinit.utils.exceptions import FileError
 
-        return self.parser.render(template_text, context)
+            raise FileError(f"Failed to write file: {path}", details=str(e)) from e
 
     def render_string(self, template_string: str, context: Dict[str, Any]) -> str:
         """Render a template string with the given context.
@@ -61,7 +100,7 @@ class TemplateEngine(BaseService):
         Returns:
             Rendered template content as string
         """
-        return self.parser.render(template_string, context)
+        return InFileLogicParser(dict(context)).render(template_string)
 
     def get_template_names(self) -> list[str]:
         """Get list of available template files."""
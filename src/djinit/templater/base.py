@@ -34,37 +34,17 @@ def create_file(
     """
     path = template_file.path
 
-    logger.debug(f"Create file, {path}, if it doesn't exist")
+    logger.debug(f"Create file, {path}")
 
-    # Ensure parent directory exists
-    if not path.parent.exists():
-        path.parent.mkdir(parents=True, exist_ok=True)
-        # Create __init__.py in parents if needed?
-        # CommonUtils.create_directory_with_init handles this usually,
-        # but here we are being more granular.
-        # For now, let's assume specific directories are created or we blindly create parents.
-        # But wait, django-new logic creates parents.
-
-    if path.exists():
-        # logic to overwrite or skip? django-new skips if exists usually,
-        # or maybe we want to force?
-        # For now, let's follow django-new:
-        logger.debug(f"Do not create template file, {path}, because it already exists")
-        # However, djinit usually overwrites or at least proceeds.
-        # Let's keep it safe.
-        pass
-        # Actually, let's overwrite if needed or warn.
-        # But CommonUtils.create_file_from_template overwrites.
-        # Let's stick to djinit behavior of overwriting/creating content.
+    # Ensure parent directory exists; mkdir with exist_ok is a single syscall when it does
+    path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Existing files are overwritten, matching CommonUtils.create_file_from_template.
     # Check explicitly passed template_name -> template_file.template_name -> path.name + "-tpl"
     tpl_name = template_name or template_file.template_name or (path.name + "-tpl")
 
     try:
-        content = template_engine.render_template(tpl_name, template_file.context)
-
-        with open(path, "w") as f:
-            f.write(content)
+        template_engine.render_to_file(tpl_name, template_file.context, path)
 
         logger.debug(f"Created template file, {path}")
         # We might want to print success via UIFormatter, but maybe keep this low level.
@@ -6,12 +6,9 @@ Provides clean, minimal styling and user interface components.
 from contextlib import contextmanager
 from typing import Any, Dict, List, Optional
 
-import questionary
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
-from rich.table import Table
 from rich.text import Text
 
 console = Console()
@@ -75,6 +72,8 @@ class UIFormatter:
     @staticmethod
     def create_live_progress(description: str = "Setup Progress", total_steps: int = 100):
         """Create a live progress display"""
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
         progress = Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]{task.description}"),
@@ -88,9 +87,8 @@ class UIFormatter:
     @staticmethod
     def print_header(text: str, style: str = UIColors.ACCENT):
         """Print a styled header"""
-        console.print(f"\n[{style}]{'═' * 70}[/{style}]")
-        console.print(f"[{style}]{text.center(70)}[/{style}]")
-        console.print(f"[{style}]{'═' * 70}[/{style}]\n")
+        rule = f"[{style}]{'═' * 70}[/{style}]"
+        console.print(f"\n{rule}\n[{style}]{text.center(70)}[/{style}]\n{rule}\n")
 
     @staticmethod
     def print_separator(char: str = "─", width: int = 70, style: str = UIColors.MUTED):
@@ -109,6 +107,8 @@ class UIFormatter:
         if not data:
             return
 
+        from rich.table import Table
+
         table = Table(title=title, box=box.ROUNDED, show_header=True, header_style="bold cyan")
 
         for key in data[0].keys():
@@ -144,17 +144,16 @@ class UIFormatter:
     ):
         """Create a minimal completion summary"""
         if success:
-            console.print("\n")
-            console.print(f"[bold green]{'═' * 70}[/bold green]")
-            console.print(f"[bold green]{f'{Icons.PARTY} SETUP COMPLETE'.center(70)}[/bold green]")
-            console.print(f"[bold green]{'═' * 70}[/bold green]\n")
+            rule = f"[bold green]{'═' * 70}[/bold green]"
+            console.print(
+                f"\n\n{rule}\n[bold green]{f'{Icons.PARTY} SETUP COMPLETE'.center(70)}[/bold green]\n{rule}\n"
+            )
         else:
-            console.print("\n")
-            console.print(f"[bold red]{'═' * 70}[/bold red]")
-            console.print(f"[bold red]{'❌ SETUP FAILED'.center(70)}[/bold red]")
-            console.print(f"[bold red]{'═' * 70}[/bold red]\n")
-            console.print("[red]Setup encountered an error. Check messages above.[/red]\n")
-            console.print(f"[bold red]{'═' * 70}[/bold red]\n")
+            rule = f"[bold red]{'═' * 70}[/bold red]"
+            console.print(
+                f"\n\n{rule}\n[bold red]{'❌ SETUP FAILED'.center(70)}[/bold red]\n{rule}\n\n"
+                f"[red]Setup encountered an error. Check messages above.[/red]\n\n{rule}\n"
+            )
 
     @staticmethod
     @contextmanager
@@ -166,6 +165,8 @@ class UIFormatter:
     @staticmethod
     def confirm(prompt: str, default: bool = True) -> bool:
         """Display a confirmation prompt as a selectable list"""
+        import questionary
+
         choices = [
             questionary.Choice("Yes", value=True),
             questionary.Choice("No", value=False),
@@ -186,6 +187,8 @@ class UIFormatter:
     @staticmethod
     def prompt(message: str, default: Optional[str] = None) -> str:
         """Display an input prompt"""
+        import questionary
+
         return questionary.text(message, default=default or "").ask()
 
     @staticmethod
@@ -196,11 +199,11 @@ class UIFormatter:
         if isinstance(e, DjinitError):
             UIFormatter.print_error(e.message, details=e.details)
         else:
-            console.print("\n")
-            console.print(f"[bold red]{'═' * 70}[/bold red]")
-            console.print(f"[bold red]{'💥 UNEXPECTED ERROR'.center(70)}[/bold red]")
-            console.print(f"[bold red]{'═' * 70}[/bold red]\n")
-            console.print(f"[red]An unexpected error occurred: {str(e)}[/red]")
-            console.print("[dim]Please report this issue on GitHub.[/dim]\n")
+            rule = f"[bold red]{'═' * 70}[/bold red]"
+            console.print(
+                f"\n\n{rule}\n[bold red]{'💥 UNEXPECTED ERROR'.center(70)}[/bold red]\n{rule}\n\n"
+                f"[red]An unexpected error occurred: {str(e)}[/red]\n"
+                "[dim]Please report this issue on GitHub.[/dim]\n"
+            )
             # Optionally print traceback for debugging if needed, or log it
             # console.print_exception()
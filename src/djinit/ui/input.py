@@ -30,6 +30,20 @@ class StructureOptions(TypedDict):
     use_gitlab: bool
 
 
+# Fixed markup is built once at import rather than on every call
+_STANDARD_NAME_HINT = f"[{UIColors.MUTED}]Common names: config, core, settings[/{UIColors.MUTED}]"
+_SINGLE_NAME_HINT = f"[{UIColors.MUTED}]Common names: project, core, app[/{UIColors.MUTED}]"
+_SUMMARY_HEADING = f"[{UIColors.INFO}]Setup Summary[/{UIColors.INFO}]"
+
+# (github_actions, gitlab_ci) flags for each CI/CD selection value
+_CICD_FLAGS = {
+    "both": (True, True),
+    "github": (True, False),
+    "gitlab": (False, True),
+    "none": (False, False),
+}
+
+
 class InputCollector:
     def __init__(self):
         pass
@@ -51,32 +65,39 @@ class InputCollector:
         return result
 
     def get_app_names(self) -> list[str]:
-        user_input = questionary.text(
-            "Enter app names (comma-separated or single, e.g. users, products, orders):",
-            validate=lambda text: True if text.strip() else "At least one app name is required",
-        ).ask()
+        # Re-prompt in a loop rather than recursing, so repeated invalid input cannot grow the stack
+        while True:
+            user_input = questionary.text(
+                "Enter app names (comma-separated or single, e.g. users, products, orders):",
+                validate=lambda text: True if text.strip() else "At least one app name is required",
+            ).ask()
 
-        if user_input is None:
-            raise KeyboardInterrupt
+            if user_input is None:
+                raise KeyboardInterrupt
 
-        if "," in user_input:
-            return self._parse_comma_separated_apps(user_input)
+            if "," in user_input:
+                app_list = self._parse_comma_separated_apps(user_input)
+            else:
+                app_list = self._get_apps_starting_with(user_input.strip())
 
-        return self._get_apps_starting_with(user_input.strip())
+            if app_list is not None:
+                return app_list
 
-    def _parse_comma_separated_apps(self, user_input: str) -> list[str]:
-        app_list = [app.strip() for app in user_input.split(",") if app.strip()]
+    def _parse_comma_separated_apps(self, user_input: str) -> list[str] | None:
+        # Strip each entry once instead of once for the filter and again for the value
+        app_list = [app for app in map(str.strip, user_input.split(",")) if app]
 
         if not app_list:
             UIFormatter.print_error("At least one app name is required")
-            return self.get_app_names()
+            return None
 
         return self._validate_app_list(app_list)
 
-    def _get_apps_starting_with(self, first_app: str) -> list[str]:
+    def _get_apps_starting_with(self, first_app: str) -> list[str] | None:
         return self._validate_app_list([first_app])
 
-    def _validate_app_list(self, app_list: list[str]) -> list[str]:
+    def _validate_app_list(self, app_list: list[str]) -> list[str] | None:
+        """Return app_list if every name is valid; otherwise report the errors and return None."""
         invalid_apps = []
         for app in app_list:
             is_valid, error_msg = validate_app_name(app)
@@ -86,7 +107,7 @@ class InputCollector:
         if invalid_apps:
             for app, error_msg in invalid_apps:
                 UIFormatter.print_error(f"Invalid app name '{app}': {error_msg}")
-            return self.get_app_names()
+            return None
 
         return app_list
 
@@ -99,7 +120,8 @@ class InputCollector:
             if not is_valid:
                 return error_msg
 
-            if os.path.exists(text):
+            # lstat only: a dangling symlink here would also make the later makedirs fail
+            if os.path.lexists(text):
                 return f"Directory '{text}' already exists."
 
             return True
@@ -139,14 +161,7 @@ class InputCollector:
         ]
 
         choice = self._get_selection("Select CI/CD pipeline:", choices, default="none")
-
-        choice_map = {
-            "both": (True, True),
-            "github": (True, False),
-            "gitlab": (False, True),
-            "none": (False, False),
-        }
-        return choice_map.get(choice, (False, False))
+        return _CICD_FLAGS.get(choice, (False, False))
 
     def get_nested_apps_config(self) -> Tuple[bool, str | None]:
         choice = UIFormatter.confirm(
@@ -245,12 +260,12 @@ def get_user_input() -> Tuple[str, str, str, list, dict]:
         single_module_name = None
 
         if use_standard:
-            console.print(f"[{UIColors.MUTED}]Common names: config, core, settings[/{UIColors.MUTED}]")
+            console.print(_STANDARD_NAME_HINT)
             project_name = collector.get_validated_input(
                 "Enter Django project name", validate_project_name, "Django project name"
             )
         elif use_single:
-            console.print(f"[{UIColors.MUTED}]Common names: project, core, app[/{UIColors.MUTED}]")
+            console.print(_SINGLE_NAME_HINT)
             single_module_name = (
                 collector.get_validated_input(
                     "Enter project configuration directory name (default: project)",
@@ -324,34 +339,26 @@ def get_user_input() -> Tuple[str, str, str, list, dict]:
 def confirm_setup(project_dir: str, project_name: str, app_names: list, metadata: dict) -> bool:
     console.print()
     UIFormatter.print_separator()
-    console.print()
-    console.print(f"[{UIColors.INFO}]Setup Summary[/{UIColors.INFO}]")
-    console.print()
 
-    console.print(f"[{UIColors.HIGHLIGHT}]Project Directory:[/{UIColors.HIGHLIGHT}] {project_dir}")
-    console.print(f"[{UIColors.HIGHLIGHT}]Django Project:[/{UIColors.HIGHLIGHT}] {project_name}")
-    console.print(f"[{UIColors.HIGHLIGHT}]Apps:[/{UIColors.HIGHLIGHT}] {', '.join(app_names)}")
-    console.print(f"[{UIColors.HIGHLIGHT}]Package:[/{UIColors.HIGHLIGHT}] {metadata['package_name']}")
+    rows = [
+        ("Project Directory", project_dir),
+        ("Django Project", project_name),
+        ("Apps", ", ".join(app_names)),
+        ("Package", metadata["package_name"]),
+        ("CI/CD", _get_cicd_display(metadata)),
+        ("Database Config", "DATABASE_URL" if metadata.get("use_database_url", True) else "Individual parameters"),
+        ("Database Type", metadata.get("database_type", "postgresql").capitalize()),
+        ("Tailwind CSS", "Yes" if metadata.get("use_tailwind", False) else "No"),
+        ("HTMX", "Yes" if metadata.get("use_htmx", False) else "No"),
+        ("Vite", "Yes" if metadata.get("use_vite", False) else "No"),
+    ]
+    # One print for the whole summary so Rich parses and flushes it once
+    summary_lines = ["", _SUMMARY_HEADING, ""]
+    highlight = UIColors.HIGHLIGHT
+    summary_lines.extend(f"[{highlight}]{label}:[/{highlight}] {value}" for label, value in rows)
+    summary_lines.append("")
+    console.print("\n".join(summary_lines))
 
-    cicd_choices = _get_cicd_display(metadata)
-    console.print(f"[{UIColors.HIGHLIGHT}]CI/CD:[/{UIColors.HIGHLIGHT}] {cicd_choices}")
-
-    db_config = "DATABASE_URL" if metadata.get("use_database_url", True) else "Individual parameters"
-    console.print(f"[{UIColors.HIGHLIGHT}]Database Config:[/{UIColors.HIGHLIGHT}] {db_config}")
-
-    db_type = metadata.get("database_type", "postgresql").capitalize()
-    console.print(f"[{UIColors.HIGHLIGHT}]Database Type:[/{UIColors.HIGHLIGHT}] {db_type}")
-
-    use_tailwind = "Yes" if metadata.get("use_tailwind", False) else "No"
-    console.print(f"[{UIColors.HIGHLIGHT}]Tailwind CSS:[/{UIColors.HIGHLIGHT}] {use_tailwind}")
-
-    use_htmx = "Yes" if metadata.get("use_htmx", False) else "No"
-    console.print(f"[{UIColors.HIGHLIGHT}]HTMX:[/{UIColors.HIGHLIGHT}] {use_htmx}")
-
-    use_vite = "Yes" if metadata.get("use_vite", False) else "No"
-    console.print(f"[{UIColors.HIGHLIGHT}]Vite:[/{UIColors.HIGHLIGHT}] {use_vite}")
-
-    console.print()
     UIFormatter.print_separator()
     console.print()
 
@@ -4,20 +4,63 @@ Contains common operations used across multiple managers.
 """
 
 import os
+import re
+import shutil
 import subprocess
 import sys
-from contextlib import contextmanager
+import tempfile
+from contextlib import suppress
+from functools import lru_cache
 
 from djinit.core.base import BaseUtils
 from djinit.templater import template_engine
 from djinit.ui.console import UIFormatter
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# First line assigning USER_DEFINED_APPS, and a line holding only the closing bracket.
+# [^\S\n] is whitespace other than newline, so matches never span lines.
+_USER_APPS_START = re.compile(r"^(?=.*USER_DEFINED_APPS)(?=.*=).*$", re.MULTILINE)
+_CLOSING_BRACKET_LINE = re.compile(r"^[^\S\n]*\][^\S\n]*$", re.MULTILINE)
+_APP_SECTION_START = re.compile(
+    r"^(?!.*USER_DEFINED_APPS)(?=.*=)(?=.*(?:BUILT_IN_APPS|THIRD_PARTY_APPS|INSTALLED_APPS)).*$", re.MULTILINE
+)
+
+
+@lru_cache(maxsize=256)
+def _app_entry_pattern(app_name: str) -> re.Pattern:
+    """Match a quoted app entry line such as `    "users",` inside USER_DEFINED_APPS."""
+    return re.compile(rf"^[^\S\n]*,*[^\S\n]*([\"']){re.escape(app_name)}\1[^\S\n]*,*[^\S\n]*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=1)
+def _ruff_command() -> tuple:
+    """Run the Ruff binary directly when it can be located, skipping the `python -m ruff` hop."""
+    try:
+        from ruff import find_ruff_bin
+
+        return (find_ruff_bin(),)
+    except (ImportError, FileNotFoundError):
+        return (sys.executable, "-m", "ruff")
+
 
 class CommonUtils(BaseUtils):
     @staticmethod
     def format_file(filename: str) -> None:
         """Format Python file using Ruff formatter."""
-        subprocess.run([sys.executable, "-m", "ruff", "format", filename], check=False, capture_output=True)
+        CommonUtils.format_files([filename])
+
+    @staticmethod
+    def format_files(filenames: list) -> None:
+        """Format several files with a single Ruff formatter invocation."""
+        if not filenames:
+            return
+        subprocess.run(
+            [*_ruff_command(), "format", *filenames],
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
 
     @staticmethod
     def create_file_with_content(
@@ -26,8 +69,7 @@ class CommonUtils(BaseUtils):
         from djinit.utils.exceptions import FileError
 
         try:
-            with open(filename, "w") as file:
-                file.write(content)
+            CommonUtils._write_bytes(filename, content.encode("utf-8"))
         except OSError as e:
             raise FileError(f"Failed to write file: {filename}", details=str(e)) from e
 
@@ -36,6 +78,40 @@ class CommonUtils(BaseUtils):
 
         UIFormatter.print_success(success_message)
 
+    @staticmethod
+    def _write_bytes(filename: str, data: bytes) -> None:
+        """Write pre-encoded content with a single write(2) in the common case."""
+        CommonUtils._write_fd(os.open(filename, _WRITE_FLAGS, 0o666), data)
+
+    @staticmethod
+    def _write_fd(fd: int, data: bytes) -> None:
+        """Write all of data to fd, then close it."""
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def replace_file_content(filename: str, content: str) -> None:
+        """Atomically replace an existing file by writing a sibling temp file and renaming it.
+
+        Symlinks are resolved so the link survives and its target is updated, and the
+        original file's permission bits are carried over to the replacement.
+        """
+        target = os.path.realpath(filename)
+        directory, name = os.path.split(target)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+        try:
+            CommonUtils._write_fd(fd, content.encode("utf-8"))
+            shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except OSError:
+            with suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
     @staticmethod
     def create_file_from_template(
         file_path: str,
@@ -55,7 +131,8 @@ class CommonUtils(BaseUtils):
 
     @staticmethod
     def create_init_file(directory: str, success_message: str) -> None:
-        init_path = os.path.join(directory, "__init__.py")
+        # Fixed, non-empty segments: plain concatenation instead of os.path.join
+        init_path = f"{directory}{os.sep}__init__.py"
         CommonUtils.create_file_from_template(
             init_path, "project/init.py-tpl", {}, success_message, should_format=False
         )
@@ -83,27 +160,18 @@ class CommonUtils(BaseUtils):
                 # Support (filename, template_path) format with empty context
                 filename, template_path = file_spec
                 context = {}
-            filepath = os.path.join(base_dir, filename)
+            filepath = f"{base_dir}{os.sep}{filename}"
             message = f"Created {prefix}{filename}" if prefix else f"Created {filename}"
             CommonUtils.create_file_from_template(
                 filepath, template_path, context, message, should_format=should_format
             )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def get_package_name(project_dir: str) -> str:
         """Get package name, defaulting to 'backend' if project_dir is '.' or empty."""
         return "backend" if project_dir == "." or not project_dir else project_dir
 
-    @staticmethod
-    @contextmanager
-    def change_cwd(path: str):
-        original_cwd = os.getcwd()
-        os.chdir(path)
-        try:
-            yield
-        finally:
-            os.chdir(original_cwd)
-
     @staticmethod
     def _parse_app_entry_from_line(line: str) -> str | None:
         """Extract app name from a line in USER_DEFINED_APPS section."""
@@ -114,23 +182,30 @@ class CommonUtils(BaseUtils):
         return None
 
     @staticmethod
-    def _is_user_apps_section_start(line: str) -> bool:
-        """Check if line starts USER_DEFINED_APPS section."""
-        return "USER_DEFINED_APPS" in line and "=" in line
+    def _user_apps_block(content: str) -> str | None:
+        """Slice the lines between the USER_DEFINED_APPS assignment and its closing bracket."""
+        start = _USER_APPS_START.search(content)
+        if start is None:
+            return None
+
+        block_start = start.end() + 1
+        close = _CLOSING_BRACKET_LINE.search(content, block_start)
+        if close is None:
+            return content[block_start:]
+        return content[block_start : max(block_start, close.start() - 1)]
 
     @staticmethod
     def _iterate_user_apps_lines(content: str):
         """Generator that yields lines within USER_DEFINED_APPS section."""
-        lines = content.split("\n")
-        in_user_apps = False
+        block = CommonUtils._user_apps_block(content)
+        if block:
+            yield from block.split("\n")
 
-        for line in lines:
-            if CommonUtils._is_user_apps_section_start(line):
-                in_user_apps = True
-            elif in_user_apps and line.strip() == "]":
-                break
-            elif in_user_apps:
-                yield line
+    @staticmethod
+    def has_user_defined_app(content: str, app_name: str) -> bool:
+        """Check whether app_name is listed in USER_DEFINED_APPS without parsing the whole file."""
+        block = CommonUtils._user_apps_block(content)
+        return bool(block) and _app_entry_pattern(app_name).search(block) is not None
 
     @staticmethod
     def extract_existing_apps(content: str) -> set:
@@ -145,20 +220,6 @@ class CommonUtils(BaseUtils):
     def format_app_entries(apps: list) -> list:
         return [f'    "{app}",' for app in apps]
 
-    @staticmethod
-    def is_app_section_start(line: str) -> bool:
-        return "=" in line and any(
-            keyword in line for keyword in ("BUILT_IN_APPS", "THIRD_PARTY_APPS", "INSTALLED_APPS")
-        )
-
-    @staticmethod
-    def is_user_apps_closing_bracket(lines: list, current_idx: int) -> bool:
-        for next_idx in range(current_idx + 1, min(current_idx + 3, len(lines))):
-            next_line = lines[next_idx].strip()
-            if next_line and "BUILT_IN_APPS" in next_line:
-                return True
-        return True  # Default to True if we're inside USER_DEFINED_APPS
-
     @staticmethod
     def split_bracket_line(line: str, apps_to_add: list) -> list:
         bracket_pos = line.rfind("]")
@@ -172,46 +233,29 @@ class CommonUtils(BaseUtils):
 
     @staticmethod
     def insert_apps_into_user_defined_apps(content: str, apps_to_add: list) -> str:
-        lines = content.split("\n")
-        new_lines = []
-        in_user_apps = False
-        apps_added = False
-
-        for i, line in enumerate(lines):
-            if CommonUtils._is_user_apps_section_start(line) and not apps_added:
-                in_user_apps = True
-
-                if "]" in line:
-                    new_lines.extend(CommonUtils.split_bracket_line(line, apps_to_add))
-                    apps_added = True
-                    in_user_apps = False
-                else:
-                    new_lines.append(line)
-
-            elif in_user_apps and line.strip() == "]" and not apps_added:
-                if CommonUtils.is_user_apps_closing_bracket(lines, i):
-                    new_lines.extend(CommonUtils.format_app_entries(apps_to_add))
-                    new_lines.append(line)
-                    apps_added = True
-                    in_user_apps = False
-                else:
-                    new_lines.append(line)
-
-            elif in_user_apps and CommonUtils.is_app_section_start(line) and not apps_added:
-                new_lines.extend(CommonUtils.format_app_entries(apps_to_add))
-                new_lines.append("]")
-                new_lines.append(line)
-                apps_added = True
-                in_user_apps = False
-
-            else:
-                new_lines.append(line)
-
-        if not apps_added:
+        start = _USER_APPS_START.search(content)
+        if start is not None and "]" in start.group():
+            # Single-line list, e.g. USER_DEFINED_APPS = []
+            new_line = "\n".join(CommonUtils.split_bracket_line(start.group(), apps_to_add))
+            return content[: start.start()] + new_line + content[start.end() :]
+
+        insert_at = None
+        entries = "".join(f"{entry}\n" for entry in CommonUtils.format_app_entries(apps_to_add))
+        if start is not None:
+            body_start = start.end() + 1
+            close = _CLOSING_BRACKET_LINE.search(content, body_start)
+            next_section = _APP_SECTION_START.search(content, body_start)
+            if next_section and (close is None or next_section.start() < close.start()):
+                # The list was never closed; close it before the next apps section
+                insert_at, entries = next_section.start(), f"{entries}]\n"
+            elif close:
+                insert_at = close.start()
+
+        if insert_at is None:
             UIFormatter.print_error("Could not find or update USER_DEFINED_APPS section in base.py")
             return None
 
-        return "\n".join(new_lines)
+        return content[:insert_at] + entries + content[insert_at:]
 
     @staticmethod
     def replace_app_in_user_defined_apps(content: str, old_app: str, new_app: str) -> str | None:
@@ -242,15 +286,27 @@ class CommonUtils(BaseUtils):
 
     @staticmethod
     def calculate_app_module_paths(app_names: list, metadata: dict) -> list:
-        nested = bool(metadata.get("nested_apps"))
-        nested_dir_name = metadata.get("nested_dir") if nested else None
-        return [CommonUtils.calculate_app_module_path(app_name, nested, nested_dir_name) for app_name in app_names]
+        # Decide nesting once for the whole list instead of per app
+        nested_dir = metadata.get("nested_dir") if metadata.get("nested_apps") else None
+        if nested_dir:
+            return [f"{nested_dir}.{app_name}" for app_name in app_names]
+        return list(app_names)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def calculate_app_module_path(app_name: str, nested: bool, nested_dir: str | None) -> str:
         return f"{nested_dir}.{app_name}" if nested and nested_dir else app_name
 
     @staticmethod
+    @lru_cache(maxsize=256)
+    def get_app_config_name(app_name: str) -> str:
+        """Get the AppConfig class name prefix for an app.
+        Example: blog_posts -> BlogPosts
+        """
+        return app_name.title().replace("_", "")
+
+    @staticmethod
+    @lru_cache(maxsize=256)
     def get_full_app_config_path(app_name: str, nested: bool, nested_dir: str | None) -> str:
         """Get the full path to the AppConfig class.
         Example: users -> users.apps.UsersConfig
@@ -258,51 +314,52 @@ class CommonUtils(BaseUtils):
         """
         module_path = CommonUtils.calculate_app_module_path(app_name, nested, nested_dir)
         # Handle cases where app_name might be a module path already
-        short_name = app_name.split(".")[-1]
-        config_name = short_name.title().replace("_", "") + "Config"
+        short_name = app_name.rpartition(".")[2]
+        config_name = CommonUtils.get_app_config_name(short_name) + "Config"
         return f"{module_path}.apps.{config_name}"
 
     @staticmethod
-    def is_django_project(directory: str = None) -> bool:
-        if directory is None:
-            directory = os.getcwd()
-        manage_py_path = os.path.join(directory, "manage.py")
-        return os.path.exists(manage_py_path)
+    def scan_directory(directory: str) -> dict[str, bool]:
+        """List a directory once, mapping each entry name to whether it is a directory."""
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
 
     @staticmethod
-    def find_project_dir(search_dir: str = None) -> tuple[str | None, str | None]:
+    def find_project_dir(
+        search_dir: str = None, entries: dict[str, bool] | None = None
+    ) -> tuple[str | None, str | None]:
+        """Find the Django config package (the directory holding settings/base.py).
+
+        Pass entries from scan_directory() to reuse an existing listing of search_dir.
+        """
         if search_dir is None:
             search_dir = os.getcwd()
-
-        for item in os.listdir(search_dir):
-            if os.path.isdir(item) and not item.startswith(".") and item != "__pycache__":
-                candidate = os.path.join(search_dir, item)
-                base_py = os.path.join(candidate, "settings", "base.py")
-                if os.path.exists(base_py):
-                    return candidate, base_py
+        if entries is None:
+            entries = CommonUtils.scan_directory(search_dir)
+
+        # Entry types come from the directory listing, so only base.py needs a stat
+        for name, is_dir in entries.items():
+            if not is_dir or name.startswith(".") or name == "__pycache__":
+                continue
+            candidate = os.path.join(search_dir, name)
+            base_py = os.path.join(candidate, "settings", "base.py")
+            if os.path.isfile(base_py):
+                return candidate, base_py
         return None, None
 
-    @staticmethod
-    def find_settings_path(search_dir: str = None) -> str | None:
-        project_dir, settings_base_path = CommonUtils.find_project_dir(search_dir)
-        if settings_base_path:
-            return os.path.dirname(settings_base_path)
-        return None
-
     @staticmethod
     def get_base_settings_path(project_root: str, project_name: str) -> str:
-        settings_dir = os.path.join(project_root, project_name, "settings")
-        return os.path.join(settings_dir, "base.py")
+        return os.path.join(project_root, project_name, "settings", "base.py")
 
     @staticmethod
     def read_base_settings(project_root: str, project_name: str) -> str | None:
         base_settings_path = CommonUtils.get_base_settings_path(project_root, project_name)
-        if not os.path.exists(base_settings_path):
+        try:
+            with open(base_settings_path, encoding="utf-8") as f:
+                return f.read()
+        except (FileNotFoundError, NotADirectoryError):
             return None
 
-        with open(base_settings_path) as f:
-            return f.read()
-
     @staticmethod
     def detect_nested_structure_from_settings(
         base_settings_path: str, search_dir: str = None
@@ -14,7 +14,18 @@ class DjangoHelper:
     DJANGO_VERSION = DJANGO_VERSION
 
     @staticmethod
-    def startproject(project_name: str, directory: str, unified: bool = False, metadata: dict = None) -> None:
+    def startproject(
+        project_name: str,
+        directory: str,
+        manage_py_only: bool = False,
+        metadata: dict = None,
+        format_queue: list = None,
+    ) -> None:
+        """Create manage.py and the project configuration package.
+
+        When format_queue is given, files that need Ruff formatting are appended to it
+        for a later batch run instead of being formatted one subprocess at a time.
+        """
         try:
             from djinit.utils.secretkey import generate_secret_key
 
@@ -22,18 +33,25 @@ class DjangoHelper:
 
             manage_py_path = os.path.join(directory, "manage.py")
             CommonUtils.create_file_from_template(
-                manage_py_path, "project/manage.py-tpl", {"project_name": project_name}, "Created manage.py"
+                manage_py_path,
+                "project/manage.py-tpl",
+                {"project_name": project_name},
+                "Created manage.py",
+                should_format=format_queue is None,
             )
+            if format_queue is not None:
+                format_queue.append(manage_py_path)
             os.chmod(manage_py_path, 0o755)
 
-            if unified:
+            if manage_py_only:
                 return
 
             project_config_dir = os.path.join(directory, project_name)
-            CommonUtils.create_directory_with_init(project_config_dir, f"Created {project_name}/__init__.py")
-
-            settings_dir = os.path.join(project_config_dir, "settings")
-            CommonUtils.create_directory_with_init(settings_dir, f"Created {project_name}/settings/__init__.py")
+            settings_dir = f"{project_config_dir}{os.sep}settings"
+            # One makedirs creates both the config package and its settings package
+            os.makedirs(settings_dir, exist_ok=True)
+            CommonUtils.create_init_file(project_config_dir, f"Created {project_name}/__init__.py")
+            CommonUtils.create_init_file(settings_dir, f"Created {project_name}/settings/__init__.py")
 
             # Generate secret key for development
             secret_key = generate_secret_key()
@@ -96,7 +114,7 @@ class DjangoHelper:
             os.makedirs(app_dir, exist_ok=True)
 
             # Prepare context
-            app_config_name = app_name.title().replace("_", "")
+            app_config_name = CommonUtils.get_app_config_name(app_name)
             context = {
                 "app_name": app_name,
                 "app_config_name": app_config_name,
@@ -126,7 +144,7 @@ class DjangoHelper:
             CommonUtils.create_files_from_templates(app_dir, app_files, f"{app_name}/")
 
             # Create migrations directory
-            migrations_dir = os.path.join(app_dir, "migrations")
+            migrations_dir = f"{app_dir}{os.sep}migrations"
             CommonUtils.create_directory_with_init(migrations_dir, f"Created {app_name}/migrations/__init__.py")
 
             return True
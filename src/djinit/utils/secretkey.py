@@ -13,9 +13,11 @@ from rich.table import Table
 console = Console()
 
 
+_SECRET_KEY_CHARS = string.ascii_letters + string.digits + "!@#$%^&*(-_=+)"
+
+
 def generate_secret_key(length: int = 50) -> str:
-    alphabet = string.ascii_letters + string.digits + "!@#$%^&*(-_=+)"
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    return "".join(secrets.choice(_SECRET_KEY_CHARS) for _ in range(length))
 
 
 def generate_multiple_keys(count: int = 3, length: int = 50) -> list[str]:
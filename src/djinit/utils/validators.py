@@ -4,37 +4,47 @@ Handles validation of project names, app names, and other user inputs.
 """
 
 import keyword
-import re
-from typing import Any, Callable, Tuple
+from functools import lru_cache
+from typing import Tuple
 
 from djinit.core.config import PYTHON_BUILTINS
 
-NAME_PATTERN = re.compile(r"^[a-zA-Z][a-zA-Z0-9_]*$")
+
+@lru_cache(maxsize=None)
+def _type_messages(name_type: str) -> Tuple[str, str, str, str, str]:
+    """Error messages that depend only on the name type, built once per type."""
+    label = name_type.capitalize()
+    return (
+        f"{label} cannot be empty",
+        f"{label} must be at least 2 characters long",
+        f"{label} must be less than 50 characters",
+        f"{label} must start with a letter and contain only letters, numbers, and underscores",
+        f"{label} should not start with underscore",
+    )
+
+
+def _matches_name_pattern(name: str) -> bool:
+    """Check the name is `[A-Za-z][A-Za-z0-9_]*`: an ASCII identifier starting with a letter."""
+    return name.isascii() and name[:1].isalpha() and name.isidentifier()
 
 
 def _validate_name(name: str, name_type: str = "name") -> Tuple[bool, str]:
-    validation_rules: list[Tuple[Callable[[str], Any], str]] = [
-        (lambda n: bool(n and n.strip()), f"{name_type.capitalize()} cannot be empty"),
-        (lambda n: len(n.strip()) >= 2, f"{name_type.capitalize()} must be at least 2 characters long"),
-        (lambda n: len(n.strip()) <= 50, f"{name_type.capitalize()} must be less than 50 characters"),
-        (
-            lambda n: NAME_PATTERN.match(n.strip()),
-            f"{name_type.capitalize()} must start with a letter and contain only letters, numbers, and underscores",
-        ),
-        (
-            lambda n: not keyword.iskeyword(n.strip()),
-            f"'{name.strip()}' is a Python keyword. Please choose a different name",
-        ),
-        (
-            lambda n: n.strip().lower() not in PYTHON_BUILTINS,
-            f"'{name.strip()}' conflicts with Python builtin module. Choose a different name",
-        ),
-        (lambda n: not n.strip().startswith("_"), f"{name_type.capitalize()} should not start with underscore"),
-    ]
-
-    for rule, error_message in validation_rules:
-        if not rule(name):
-            return False, error_message
+    empty, too_short, too_long, bad_chars, leading_underscore = _type_messages(name_type)
+
+    stripped = name.strip() if name else ""
+    if not stripped:
+        return False, empty
+    if not 2 <= len(stripped) <= 50:
+        return False, too_short if len(stripped) < 2 else too_long
+    if not _matches_name_pattern(stripped):
+        return False, bad_chars
+    if keyword.iskeyword(stripped):
+        return False, f"'{stripped}' is a Python keyword. Please choose a different name"
+    # Names that passed the pattern check are usually already lowercase; skip the copy then
+    if (stripped if stripped.islower() else stripped.lower()) in PYTHON_BUILTINS:
+        return False, f"'{stripped}' conflicts with Python builtin module. Choose a different name"
+    if stripped.startswith("_"):
+        return False, leading_underscore
 
     return True, ""
 